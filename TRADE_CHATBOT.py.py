@@ -1,9 +1,72 @@
 import logging  # For keeping track of what happens
-import json     # For handling data
+import logging.handlers  # For writing logs in the background
+import queue    # For passing log messages to the background writer
+import atexit   # For cleaning up when the program ends
+import sys      # For writing messages to the screen
 import time     # For time-related functions
-from binance import Client  # The main Binance library
+import math     # For spotting "nan" and "inf" typed in as numbers
+import asyncio  # For doing several things at once
+import collections  # For filling in missing order fields
+import contextlib  # For "async with" helpers
+from requests.adapters import HTTPAdapter  # For reusing connections to Binance
+from urllib3.util.retry import Retry  # For retrying when the network hiccups
+from binance import AsyncClient, Client, ThreadedWebsocketManager  # The main Binance library
 from binance.exceptions import BinanceAPIException, BinanceOrderException  # For handling errors
 
+# The only order sides Binance accepts
+_VALID_SIDES = frozenset(("BUY", "SELL"))
+
+# How one order is written to the log, filled straight from Binance's order dict
+_ORDER_LOG_FMT = ("Order details: orderId=%(orderId)s symbol=%(symbol)s side=%(side)s type=%(type)s "
+                  "status=%(status)s qty=%(origQty)s price=%(price)s filled=%(executedQty)s")
+
+# Passed as the price when there is none (NaN is the only float that isn't equal to itself)
+NO_PRICE = float("nan")
+
+# Set the first time jit_valid_nums() is called
+_jit_valid_nums = None
+
+
+def _valid_nums(amount, price):
+    """
+    Check the numbers of an order: amount must be positive, and price too unless it is NO_PRICE
+    Only uses plain float maths so Numba can compile it; a real price must be finite, not NaN
+    """
+    return amount > 0 and (price != price or price > 0)
+
+
+def jit_valid_nums():
+    """
+    Get a Numba-compiled _valid_nums for strategies that check many orders inside their own @njit code
+    The bot itself never calls this (is_valid_input uses the plain version); it is only a hook for
+    external strategies. Numba is only imported the first time this is called
+    """
+    global _jit_valid_nums
+    if _jit_valid_nums is None:
+        from numba import njit
+        _jit_valid_nums = njit(cache=True)(_valid_nums)
+    return _jit_valid_nums
+
+
+# The menu we show the user, built once
+MENU = "\n".join([
+    "\n" + "=" * 50,
+    " WHAT WOULD YOU LIKE TO DO?",
+    "=" * 50,
+    "1.  Check Account Balance",
+    "2.  Get Current Price",
+    "3.  Buy Crypto (Market Order)",
+    "4.  Sell Crypto (Market Order)",
+    "5.  Buy at Specific Price (Limit Order)",
+    "6.  Sell at Specific Price (Limit Order)",
+    "7.  Check Order Status",
+    "8.  See My Open Orders",
+    "9.  Cancel an Order",
+    "10.  Exit",
+    "Type 'help' to see this menu again",
+    "=" * 50,
+])
+
 
 class TradingBot:
     """
@@ -11,7 +74,11 @@ class TradingBot:
     Think of it like a robot that can trade for us
     """
     
-    def __init__(self, api_key, api_secret, use_testnet=True):
+    # Use the testnet (fake money for practice) unless told otherwise
+    use_testnet = True
+    
+    def __init__(self, api_key, api_secret, use_testnet=None, price_ttl=1.0, watchlist=None,
+                 watch_orders=False, stream_ttl=30.0):
         """
         This function runs when we create our bot
         It's like turning on the robot
@@ -23,7 +90,31 @@ class TradingBot:
         self.api_secret = api_secret
         
         # Create connection to Binance (testnet means fake money for practice)
-        self.client = Client(api_key, api_secret, testnet=use_testnet)
+        if use_testnet is not None:
+            self.use_testnet = use_testnet
+        self.client = Client(api_key, api_secret, testnet=self.use_testnet)
+        
+        # Keep a pool of open connections so each call doesn't start a new TLS handshake
+        # (retries only apply to GET requests, never to placing or cancelling orders)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32,
+                              max_retries=Retry(total=3, backoff_factor=0.1, allowed_methods=frozenset({"GET"})))
+        self.client.session.mount("https://", adapter)
+        
+        # Remember recent prices for a short time so we don't ask Binance again and again
+        # symbol -> (price, expires_at)
+        self.price_ttl = price_ttl
+        self._price_cache = {}
+        
+        # Prices pushed by the websocket stay usable longer, the stream keeps them up to date
+        self.stream_ttl = stream_ttl
+        
+        # Latest order updates pushed by Binance: order_id -> order info
+        self._order_status = {}
+        self.twm = None
+        
+        # Async client shared by refresh_all calls inside "async with bot.async_session()"
+        self.async_client = None
+        self._async_client_loop = None
         
         # Set up logging (like keeping a diary of what we do)
         self.setup_logging()
@@ -31,27 +122,123 @@ class TradingBot:
         # Test if we can connect to Binance
         try:
             self.client.ping()  # Like saying "hello" to Binance
-            print(" Successfully connected to Binance!")
-            self.logger.info("Bot connected successfully")
+            self.logger.info(" Successfully connected to Binance!")
         except Exception as error:
-            print(f" Failed to connect: {error}")
-            self.logger.error(f"Connection failed: {error}")
+            self.logger.error(" Failed to connect: %s", error)
             raise  # Stop the program if we can't connect
+        
+        # Listen for live order updates and prices instead of asking every time
+        if watch_orders:
+            self.start_order_stream()
+        if watchlist:
+            self.start_price_streams(watchlist)
+    
+    def _start_twm(self):
+        """
+        Start the websocket manager the first time a stream is needed
+        """
+        if self.twm is None:
+            self.twm = ThreadedWebsocketManager(self.api_key, self.api_secret, testnet=self.use_testnet)
+            self.twm.start()
+            atexit.register(self.stop_streams)  # Close the sockets when we exit
+    
+    def start_price_streams(self, symbols):
+        """
+        Subscribe to live prices from Binance
+        Like turning on the radio instead of calling the shop every few minutes
+        """
+        self._start_twm()
+        for symbol in symbols:
+            self.twm.start_symbol_ticker_futures_socket(callback=self._on_ticker, symbol=symbol)
+        self.logger.info("Streaming prices for %s", ", ".join(symbols))
+    
+    def start_order_stream(self):
+        """
+        Subscribe to live updates of our own orders from Binance
+        """
+        self._start_twm()
+        self.twm.start_futures_user_socket(callback=self._on_user)
+        self.logger.info("Streaming order updates")
+    
+    def stop_streams(self):
+        """
+        Stop listening for live updates
+        """
+        if self.twm:
+            self.twm.stop()
+            self.twm = None
+    
+    @contextlib.asynccontextmanager
+    async def async_session(self):
+        """
+        Keep one async client open so several refresh_all calls share its connections
+        Use it as: async with bot.async_session(): ...
+        The client is closed when the block ends
+        """
+        if self.async_client is not None:
+            raise RuntimeError("An async session is already open")
+        self.async_client = await AsyncClient.create(self.api_key, self.api_secret, testnet=self.use_testnet)
+        self._async_client_loop = asyncio.get_running_loop()
+        try:
+            yield self.async_client
+        finally:
+            await self.async_client.close_connection()
+            self.async_client = None
+            self._async_client_loop = None
+    
+    def _on_ticker(self, msg):
+        """
+        Called by the websocket every time a new price arrives
+        """
+        data = msg.get('data', msg)
+        if data.get('e') == '24hrTicker':
+            self._price_cache[data['s']] = (float(data['c']), time.monotonic() + self.stream_ttl)
+    
+    def _on_user(self, msg):
+        """
+        Called by the websocket every time one of our orders changes
+        """
+        data = msg.get('data', msg)
+        if data.get('e') == 'ORDER_TRADE_UPDATE':
+            update = data['o']
+            self._order_status[update['i']] = {
+                'orderId': update['i'],
+                'symbol': update['s'],
+                'side': update['S'],
+                'type': update['o'],
+                'status': update['X'],
+                'origQty': update['q'],
+                'price': update['p'],
+                'executedQty': update['z']
+            }
     
     def setup_logging(self):
         """
         This sets up our logging system
         Like setting up a notebook to write down everything that happens
         """
-        logging.basicConfig(
-            level=logging.INFO,  # What level of detail to log
-            format='%(asctime)s - %(levelname)s - %(message)s',  # How to format our logs
-            handlers=[
-                logging.FileHandler('my_trading_bot.log'),  # Save to file
-                logging.StreamHandler()  # Also show on screen
-            ]
-        )
         self.logger = logging.getLogger('TradingBot')
+        self.logger.setLevel(logging.INFO)  # What level of detail to log
+        
+        # Only set things up once, even if we create more than one bot
+        if not self.logger.handlers:
+            file_handler = logging.FileHandler('my_trading_bot.log')  # Save to file
+            file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            
+            # Messages also go to the screen, replacing print(), so each one is formatted once.
+            # This one writes straight away so it stays in order with the input() prompts
+            stream_handler = logging.StreamHandler(sys.stdout)
+            stream_handler.setLevel(logging.INFO)
+            stream_handler.setFormatter(logging.Formatter('%(message)s'))
+            self.logger.addHandler(stream_handler)
+            
+            # For the file the bot just drops messages in a queue; a background thread writes them out
+            log_queue = queue.Queue(-1)
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self.logger.propagate = False
+            listener = logging.handlers.QueueListener(log_queue, file_handler)
+            listener.start()
+            atexit.register(listener.stop)  # Write out anything left when we exit
         print("Logging system ready!")
     
     def check_my_account(self):
@@ -65,14 +252,11 @@ class TradingBot:
             
             # Get the total balance
             balance = account_info.get('totalWalletBalance', '0')
-            print(f"Your account balance: {balance} USDT")
-            
-            self.logger.info(f"Account balance checked: {balance} USDT")
+            self.logger.info("Your account balance: %s USDT", balance)
             return account_info
             
         except BinanceAPIException as error:
-            print(f"Error checking account: {error}")
-            self.logger.error(f"Account check failed: {error}")
+            self.logger.error("Error checking account: %s", error)
             return None
     
     def get_price(self, symbol):
@@ -80,22 +264,92 @@ class TradingBot:
         Get the current price of a cryptocurrency
         Like checking the price tag in a store
         """
+        # Use the remembered price if it is still fresh
+        now = time.monotonic()
+        cached = self._price_cache.get(symbol)
+        if cached and cached[1] > now:
+            self.logger.info("Current price of %s: $%s", symbol, cached[0])
+            return cached[0]
+        
+        print(f" Getting price for {symbol}...")
+        prices = self.get_prices([symbol])
+        if prices is None:
+            return None  # get_prices already reported the error
+        if symbol not in prices:
+            self.logger.error(" Could not find a price for %s", symbol)
+            return None
+        
+        price = prices[symbol]
+        self.logger.info("Current price of %s: $%s", symbol, price)
+        return price
+    
+    def get_prices(self, symbols):
+        """
+        Get the current prices of several cryptocurrencies in one go
+        Like reading the whole price board instead of asking about each item
+        Returns None if Binance couldn't be asked
+        """
+        now = time.monotonic()
+        prices = {}
+        for symbol in symbols:
+            cached = self._price_cache.get(symbol)
+            if cached and cached[1] > now:
+                prices[symbol] = cached[0]
+        
+        # Everything was still fresh, no need to ask Binance
+        if len(prices) == len(symbols):
+            return prices
+        
+        try:
+            # Without a symbol Binance sends every price in a single answer
+            all_prices = self.client.futures_symbol_ticker()
+        except BinanceAPIException as error:
+            self.logger.error(" Error getting prices for %s: %s", symbols, error)
+            return None
+        
+        # Remember all of them, the next symbol we are asked about is probably in here
+        expires_at = now + self.price_ttl
+        for price_info in all_prices:
+            self._price_cache[price_info['symbol']] = (float(price_info['price']), expires_at)
+        
+        return {symbol: self._price_cache[symbol][0] for symbol in symbols if symbol in self._price_cache}
+    
+    async def refresh_all(self, symbols):
+        """
+        Get the account, the prices of several symbols and the open orders all at once
+        Like sending several friends to different shops at the same time
+        Run it once with: asyncio.run(bot.refresh_all(["BTCUSDT", "ETHUSDT"]))
+        or several times inside "async with bot.async_session():" to reuse the connections
+        """
+        # Use the open session's client, otherwise make one just for this refresh
+        client = self.async_client
+        own_client = client is None
+        if own_client:
+            client = await AsyncClient.create(self.api_key, self.api_secret, testnet=self.use_testnet)
+        elif self._async_client_loop is not asyncio.get_running_loop():
+            # aiohttp sessions only work on the event loop they were made on
+            raise RuntimeError("refresh_all must run on the same event loop as async_session()")
         try:
-            print(f" Getting price for {symbol}...")
-            
-            # Get price information
-            price_info = self.client.futures_symbol_ticker(symbol=symbol)
-            current_price = price_info['price']
-            
-            print(f"Current price of {symbol}: ${current_price}")
-            self.logger.info(f"Price for {symbol}: {current_price}")
-            
-            return float(current_price)
-            
+            # Without a symbol Binance sends every price in a single answer
+            account_info, open_orders, all_prices = await asyncio.gather(
+                client.futures_account(),
+                client.futures_get_open_orders(),
+                client.futures_symbol_ticker()
+            )
         except BinanceAPIException as error:
-            print(f" Error getting price for {symbol}: {error}")
-            self.logger.error(f"Price check failed for {symbol}: {error}")
+            self.logger.error(" Error refreshing data: %s", error)
             return None
+        finally:
+            if own_client:
+                await client.close_connection()
+        
+        expires_at = time.monotonic() + self.price_ttl
+        for price_info in all_prices:
+            self._price_cache[price_info['symbol']] = (float(price_info['price']), expires_at)
+        prices = {symbol: self._price_cache[symbol][0] for symbol in symbols if symbol in self._price_cache}
+        
+        self.logger.info("Refreshed account, %d open orders and prices: %s", len(open_orders), prices)
+        return {'account': account_info, 'open_orders': open_orders, 'prices': prices}
     
     def buy_crypto(self, symbol, amount):
         """
@@ -114,19 +368,17 @@ class TradingBot:
             )
             
             order_id = order['orderId']
-            print(f" Buy order successful! Order ID: {order_id}")
+            self.logger.info(" Buy order successful! Order ID: %s", order_id)
             
             # Log the details
             self.log_order_info(order)
             return order
             
         except BinanceOrderException as error:
-            print(f" Buy order failed: {error}")
-            self.logger.error(f"Buy order failed: {error}")
+            self.logger.error(" Buy order failed: %s", error)
             return None
         except BinanceAPIException as error:
-            print(f"API error during buy: {error}")
-            self.logger.error(f"API error during buy: {error}")
+            self.logger.error("API error during buy: %s", error)
             return None
     
     def sell_crypto(self, symbol, amount):
@@ -146,19 +398,17 @@ class TradingBot:
             )
             
             order_id = order['orderId']
-            print(f"Sell order successful! Order ID: {order_id}")
+            self.logger.info("Sell order successful! Order ID: %s", order_id)
             
             # Log the details
             self.log_order_info(order)
             return order
             
         except BinanceOrderException as error:
-            print(f" Sell order failed: {error}")
-            self.logger.error(f"Sell order failed: {error}")
+            self.logger.error(" Sell order failed: %s", error)
             return None
         except BinanceAPIException as error:
-            print(f" API error during sell: {error}")
-            self.logger.error(f"API error during sell: {error}")
+            self.logger.error(" API error during sell: %s", error)
             return None
     
     def buy_at_specific_price(self, symbol, amount, price):
@@ -180,19 +430,17 @@ class TradingBot:
             )
             
             order_id = order['orderId']
-            print(f"Limit buy order placed! Order ID: {order_id}")
+            self.logger.info("Limit buy order placed! Order ID: %s", order_id)
             print(f"The order will execute when {symbol} price reaches ${price}")
             
             self.log_order_info(order)
             return order
             
         except BinanceOrderException as error:
-            print(f" Limit buy order failed: {error}")
-            self.logger.error(f"Limit buy order failed: {error}")
+            self.logger.error(" Limit buy order failed: %s", error)
             return None
         except BinanceAPIException as error:
-            print(f" API error during limit buy: {error}")
-            self.logger.error(f"API error during limit buy: {error}")
+            self.logger.error(" API error during limit buy: %s", error)
             return None
     
     def sell_at_specific_price(self, symbol, amount, price):
@@ -214,19 +462,17 @@ class TradingBot:
             )
             
             order_id = order['orderId']
-            print(f" Limit sell order placed! Order ID: {order_id}")
+            self.logger.info(" Limit sell order placed! Order ID: %s", order_id)
             print(f"The order will execute when {symbol} price reaches ${price}")
             
             self.log_order_info(order)
             return order
             
         except BinanceOrderException as error:
-            print(f" Limit sell order failed: {error}")
-            self.logger.error(f"Limit sell order failed: {error}")
+            self.logger.error(" Limit sell order failed: %s", error)
             return None
         except BinanceAPIException as error:
-            print(f" API error during limit sell: {error}")
-            self.logger.error(f"API error during limit sell: {error}")
+            self.logger.error(" API error during limit sell: %s", error)
             return None
     
     def check_order_status(self, symbol, order_id):
@@ -237,13 +483,16 @@ class TradingBot:
         try:
             print(f" Checking status of order {order_id}...")
             
-            order = self.client.futures_get_order(symbol=symbol, orderId=order_id)
+            # Use the live update if we have one, otherwise ask Binance
+            order = self._order_status.get(order_id)
+            if order is None:
+                order = self.client.futures_get_order(symbol=symbol, orderId=order_id)
             
             status = order['status']
             filled_amount = order['executedQty']
             total_amount = order['origQty']
             
-            print(f"Order Status: {status}")
+            self.logger.info("Order %s status: %s", order_id, status)
             print(f"Filled: {filled_amount} out of {total_amount}")
             
             if status == 'FILLED':
@@ -255,12 +504,10 @@ class TradingBot:
             elif status == 'CANCELED':
                 print(" Order was cancelled")
             
-            self.logger.info(f"Order {order_id} status: {status}")
             return order
             
         except BinanceAPIException as error:
-            print(f" Error checking order status: {error}")
-            self.logger.error(f"Order status check failed: {error}")
+            self.logger.error(" Error checking order status: %s", error)
             return None
     
     def cancel_order(self, symbol, order_id):
@@ -273,13 +520,11 @@ class TradingBot:
             
             result = self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
             
-            print(f"Order {order_id} cancelled successfully!")
-            self.logger.info(f"Order {order_id} cancelled")
+            self.logger.info("Order %s cancelled successfully!", order_id)
             return result
             
         except BinanceAPIException as error:
-            print(f" Error cancelling order: {error}")
-            self.logger.error(f"Order cancellation failed: {error}")
+            self.logger.error(" Error cancelling order: %s", error)
             return None
     
     def see_my_open_orders(self, symbol=None):
@@ -296,7 +541,7 @@ class TradingBot:
                 print("No open orders found")
                 return []
             
-            print(f"You have {len(orders)} open orders:")
+            self.logger.info("You have %d open orders:", len(orders))
             print("-" * 50)
             
             for order in orders:
@@ -308,12 +553,10 @@ class TradingBot:
                 print(f"Status: {order['status']}")
                 print("-" * 50)
             
-            self.logger.info(f"Retrieved {len(orders)} open orders")
             return orders
             
         except BinanceAPIException as error:
-            print(f" Error getting open orders: {error}")
-            self.logger.error(f"Open orders check failed: {error}")
+            self.logger.error(" Error getting open orders: %s", error)
             return []
     
     def log_order_info(self, order):
@@ -321,18 +564,9 @@ class TradingBot:
         Save order information to our log file
         Like keeping a receipt of what we did
         """
-        order_details = {
-            'Order ID': order.get('orderId'),
-            'Symbol': order.get('symbol'),
-            'Side': order.get('side'),
-            'Type': order.get('type'),
-            'Status': order.get('status'),
-            'Amount': order.get('origQty'),
-            'Price': order.get('price'),
-            'Filled': order.get('executedQty')
-        }
-        
-        self.logger.info(f"Order details: {json.dumps(order_details, indent=2)}")
+        # Binance already uses these key names, so logging can fill them in (only if INFO is on);
+        # any field missing from the order shows as None instead of breaking the log line
+        self.logger.info(_ORDER_LOG_FMT, collections.defaultdict(lambda: None, order))
     
     def is_valid_input(self, symbol, side, amount, price=None):
         """
@@ -345,23 +579,135 @@ class TradingBot:
             return False
         
         # Check if side is valid
-        if side not in ['BUY', 'SELL']:
+        if side not in _VALID_SIDES:
             print(" Invalid side! Please enter 'BUY' or 'SELL'")
             return False
         
-        # Check if amount is valid
-        if amount <= 0:
+        # "nan" and "inf" are accepted by float() but are never a real amount or price
+        if not math.isfinite(amount):
             print(" Invalid amount! Amount must be greater than 0")
             return False
-        
-        # Check if price is valid (if provided)
-        if price is not None and price <= 0:
+        if price is not None and not math.isfinite(price):
             print(" Invalid price! Price must be greater than 0")
             return False
         
+        # Check if amount and price (if provided) are valid
+        if not _valid_nums(amount, NO_PRICE if price is None else price):
+            if not amount > 0:
+                print(" Invalid amount! Amount must be greater than 0")
+            else:
+                print(" Invalid price! Price must be greater than 0")
+            return False
+        
         return True
 
 
+def check_balance(bot):
+    """Menu option 1: check account balance"""
+    bot.check_my_account()
+
+
+def show_price(bot):
+    """Menu option 2: get current price"""
+    symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
+    if symbol:
+        bot.get_price(symbol)
+    else:
+        print(" Please enter a valid symbol!")
+
+
+def market_buy(bot):
+    """Menu option 3: buy crypto (market order)"""
+    symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
+    try:
+        amount = float(input("Enter amount to buy: "))
+        if bot.is_valid_input(symbol, 'BUY', amount):
+            bot.buy_crypto(symbol, amount)
+    except ValueError:
+        print(" Please enter a valid number for amount!")
+
+
+def market_sell(bot):
+    """Menu option 4: sell crypto (market order)"""
+    symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
+    try:
+        amount = float(input("Enter amount to sell: "))
+        if bot.is_valid_input(symbol, 'SELL', amount):
+            bot.sell_crypto(symbol, amount)
+    except ValueError:
+        print(" Please enter a valid number for amount!")
+
+
+def limit_buy(bot):
+    """Menu option 5: buy at specific price (limit order)"""
+    symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
+    try:
+        amount = float(input("Enter amount to buy: "))
+        price = float(input("Enter price you want to buy at: "))
+        if bot.is_valid_input(symbol, 'BUY', amount, price):
+            bot.buy_at_specific_price(symbol, amount, price)
+    except ValueError:
+        print(" Please enter valid numbers!")
+
+
+def limit_sell(bot):
+    """Menu option 6: sell at specific price (limit order)"""
+    symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
+    try:
+        amount = float(input("Enter amount to sell: "))
+        price = float(input("Enter price you want to sell at: "))
+        if bot.is_valid_input(symbol, 'SELL', amount, price):
+            bot.sell_at_specific_price(symbol, amount, price)
+    except ValueError:
+        print(" Please enter valid numbers!")
+
+
+def order_status(bot):
+    """Menu option 7: check order status"""
+    symbol = input("Enter symbol: ").strip().upper()
+    try:
+        order_id = int(input("Enter order ID: "))
+        bot.check_order_status(symbol, order_id)
+    except ValueError:
+        print(" Please enter a valid order ID (number)!")
+
+
+def open_orders(bot):
+    """Menu option 8: see open orders"""
+    symbol = input("Enter symbol (or press Enter for all): ").strip().upper()
+    symbol = symbol if symbol else None
+    bot.see_my_open_orders(symbol)
+
+
+def cancel(bot):
+    """Menu option 9: cancel an order"""
+    symbol = input("Enter symbol: ").strip().upper()
+    try:
+        order_id = int(input("Enter order ID to cancel: "))
+        bot.cancel_order(symbol, order_id)
+    except ValueError:
+        print(" Please enter a valid order ID (number)!")
+
+
+def unknown_choice(bot):
+    """Anything that isn't on the menu"""
+    print(" Invalid choice! Please enter a number between 1-10, or 'help'")
+
+
+# Which function to run for each menu choice
+ACTIONS = {
+    '1': check_balance,
+    '2': show_price,
+    '3': market_buy,
+    '4': market_sell,
+    '5': limit_buy,
+    '6': limit_sell,
+    '7': order_status,
+    '8': open_orders,
+    '9': cancel,
+}
+
+
 def main():
     """
     This is the main function that runs our program
@@ -396,123 +742,23 @@ def main():
         print("\n Checking your account...")
         bot.check_my_account()
         
-        # Main menu loop
+        # Main menu loop (the menu is only shown again when asked for)
+        print(MENU)
         while True:
-            print("\n" + "=" * 50)
-            print(" WHAT WOULD YOU LIKE TO DO?")
-            print("=" * 50)
-            print("1.  Check Account Balance")
-            print("2.  Get Current Price")
-            print("3.  Buy Crypto (Market Order)")
-            print("4.  Sell Crypto (Market Order)")
-            print("5.  Buy at Specific Price (Limit Order)")
-            print("6.  Sell at Specific Price (Limit Order)")
-            print("7.  Check Order Status")
-            print("8.  See My Open Orders")
-            print("9.  Cancel an Order")
-            print("10.  Exit")
-            print("=" * 50)
-            
-            choice = input("Enter your choice (1-10): ").strip()
-            
-            if choice == '1':
-                # Check account balance
-                print("\n" + "-" * 30)
-                bot.check_my_account()
-                
-            elif choice == '2':
-                # Get current price
-                print("\n" + "-" * 30)
-                symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
-                if symbol:
-                    bot.get_price(symbol)
-                else:
-                    print(" Please enter a valid symbol!")
-                    
-            elif choice == '3':
-                # Buy crypto (market order)
-                print("\n" + "-" * 30)
-                symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
-                try:
-                    amount = float(input("Enter amount to buy: "))
-                    if bot.is_valid_input(symbol, 'BUY', amount):
-                        bot.buy_crypto(symbol, amount)
-                except ValueError:
-                    print(" Please enter a valid number for amount!")
-                    
-            elif choice == '4':
-                # Sell crypto (market order)
-                print("\n" + "-" * 30)
-                symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
-                try:
-                    amount = float(input("Enter amount to sell: "))
-                    if bot.is_valid_input(symbol, 'SELL', amount):
-                        bot.sell_crypto(symbol, amount)
-                except ValueError:
-                    print(" Please enter a valid number for amount!")
-                    
-            elif choice == '5':
-                # Buy at specific price (limit order)
-                print("\n" + "-" * 30)
-                symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
-                try:
-                    amount = float(input("Enter amount to buy: "))
-                    price = float(input("Enter price you want to buy at: "))
-                    if bot.is_valid_input(symbol, 'BUY', amount, price):
-                        bot.buy_at_specific_price(symbol, amount, price)
-                except ValueError:
-                    print(" Please enter valid numbers!")
-                    
-            elif choice == '6':
-                # Sell at specific price (limit order)
-                print("\n" + "-" * 30)
-                symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
-                try:
-                    amount = float(input("Enter amount to sell: "))
-                    price = float(input("Enter price you want to sell at: "))
-                    if bot.is_valid_input(symbol, 'SELL', amount, price):
-                        bot.sell_at_specific_price(symbol, amount, price)
-                except ValueError:
-                    print(" Please enter valid numbers!")
-                    
-            elif choice == '7':
-                # Check order status
-                print("\n" + "-" * 30)
-                symbol = input("Enter symbol: ").strip().upper()
-                try:
-                    order_id = int(input("Enter order ID: "))
-                    bot.check_order_status(symbol, order_id)
-                except ValueError:
-                    print(" Please enter a valid order ID (number)!")
-                    
-            elif choice == '8':
-                # See open orders
-                print("\n" + "-" * 30)
-                symbol = input("Enter symbol (or press Enter for all): ").strip().upper()
-                symbol = symbol if symbol else None
-                bot.see_my_open_orders(symbol)
-                
-            elif choice == '9':
-                # Cancel order
-                print("\n" + "-" * 30)
-                symbol = input("Enter symbol: ").strip().upper()
-                try:
-                    order_id = int(input("Enter order ID to cancel: "))
-                    bot.cancel_order(symbol, order_id)
-                except ValueError:
-                    print(" Please enter a valid order ID (number)!")
-                    
-            elif choice == '10':
+            choice = input("\nEnter your choice (1-10, or 'help'): ").strip().lower()
+            
+            if choice == 'help':
+                print(MENU)
+                continue
+            
+            if choice == '10':
                 # Exit
                 print("\n Thanks for using the trading bot!")
                 print("Happy trading! ")
                 break
-                
-            else:
-                print(" Invalid choice! Please enter a number between 1-10")
             
-            # Wait a moment before showing menu again
-            input("\nPress Enter to continue...")
+            print("-" * 30)
+            ACTIONS.get(choice, unknown_choice)(bot)
     
     except Exception as error:
         print(f"\n Something went wrong: {error}")
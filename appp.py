@@ -1,11 +1,20 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 import sqlite3
+import atexit
+import itertools
+import time
 from datetime import datetime
 
-# Initialize database
+conn = None
+
+# Initialize database (one connection shared for the whole session)
 def init_db():
-    conn = sqlite3.connect("issues.db")
+    global conn
+    conn = sqlite3.connect("issues.db", check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    atexit.register(conn.close)
     c = conn.cursor()
     c.execute('''
         CREATE TABLE IF NOT EXISTS issues (
@@ -13,76 +22,158 @@ def init_db():
             title TEXT NOT NULL,
             description TEXT NOT NULL,
             location TEXT NOT NULL,
-            timestamp TEXT,
+            timestamp INTEGER,
             status TEXT DEFAULT "Open"
         )
     ''')
-    conn.commit()
-    conn.close()
+    c.execute("CREATE INDEX IF NOT EXISTS idx_issues_status ON issues(status, id DESC)")
 
 init_db()
 
+# Timestamps are stored as Unix seconds. Databases created before that keep a TEXT column,
+# so new rows there come back as digit strings; old rows hold "%Y-%m-%d %H:%M:%S" text
+def format_timestamp(timestamp):
+    if isinstance(timestamp, str) and timestamp.isdigit():
+        timestamp = int(timestamp)
+    if isinstance(timestamp, int):
+        return datetime.fromtimestamp(timestamp).isoformat(" ", "seconds")
+    return timestamp
+
+# Insert many issues in one transaction; rows are (title, description, location, timestamp)
+def submit_issues_bulk(rows):
+    # The connection is in autocommit mode, so open the transaction explicitly;
+    # "with conn" then commits it (or rolls it back on error)
+    conn.execute("BEGIN")
+    with conn:
+        conn.executemany("INSERT INTO issues (title, description, location, timestamp) VALUES (?, ?, ?, ?)",
+                         rows)
+
 # Submit issue function
 def submit_issue():
     title = title_entry.get()
     description = desc_entry.get("1.0", tk.END).strip()
     location = location_entry.get()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = int(time.time())
 
     if not title or not description or not location:
         messagebox.showerror("Error", "All fields are required.")
         return
 
-    conn = sqlite3.connect("issues.db")
-    c = conn.cursor()
-    c.execute("INSERT INTO issues (title, description, location, timestamp) VALUES (?, ?, ?, ?)",
-              (title, description, location, timestamp))
-    conn.commit()
-    conn.close()
+    submit_issues_bulk([(title, description, location, timestamp)])
     messagebox.showinfo("Success", "Issue submitted!")
 
     title_entry.delete(0, tk.END)
     desc_entry.delete("1.0", tk.END)
     location_entry.delete(0, tk.END)
 
-# Show issues with filter
-def show_issues(status_filter=None):
-    issues_window = tk.Toplevel(root)
-    issues_window.title("Reported Issues")
+# Trees that already have a rebuild queued, so rapid changes cause only one
+pending_refresh = set()
 
-    conn = sqlite3.connect("issues.db")
+# Cursor over the issues matching the filter, newest first
+def query_issues(status_filter=None):
     c = conn.cursor()
     if status_filter:
-        c.execute("SELECT * FROM issues WHERE status=?", (status_filter,))
+        c.execute("SELECT id, title, description, location, timestamp, status FROM issues "
+                  "WHERE status=? ORDER BY id DESC", (status_filter,))
     else:
-        c.execute("SELECT * FROM issues")
-    issues = c.fetchall()
-    conn.close()
+        c.execute("SELECT id, title, description, location, timestamp, status FROM issues "
+                  "ORDER BY id DESC")
+    return c
 
-    if not issues:
-        tk.Label(issues_window, text="No issues found.").pack()
+def insert_issue_rows(tree, rows):
+    for id_, title, desc, loc, timestamp, status in rows:
+        tree.insert("", "end", iid=str(id_), values=(id_, status, title, loc, format_timestamp(timestamp), desc))
+
+# Queue a rebuild of the tree for after the current event instead of doing it in the callback
+def schedule_refresh(tree, status_filter=None):
+    if tree in pending_refresh:
+        return
+    pending_refresh.add(tree)
+    root.after_idle(lambda: refresh_tree(tree, status_filter))
+
+def refresh_tree(tree, status_filter=None):
+    pending_refresh.discard(tree)
+    if not tree.winfo_exists():
         return
+    tree.delete(*tree.get_children())
+    insert_issue_rows(tree, query_issues(status_filter))
+    tree.event_generate("<<TreeviewSelect>>")
 
-    for issue in issues:
-        id_, title, desc, loc, time, status = issue
-        issue_text = f"[{status}] {title} ({loc})\nReported: {time}\n{desc}\n"
-        label = tk.Label(issues_window, text=issue_text, justify="left", wraplength=400)
-        label.pack(anchor="w", padx=10, pady=5)
+# Show issues with filter
+def show_issues(status_filter=None):
+    issues_window = tk.Toplevel(root)
+    issues_window.title("Reported Issues")
 
-        if status == "Open":
-            resolve_btn = tk.Button(issues_window, text="Mark as Resolved",
-                                    command=lambda i=id_: resolve_issue(i, issues_window))
-            resolve_btn.pack(anchor="w", padx=10)
+    c = query_issues(status_filter)
+    # Read rows straight off the cursor instead of loading them all with fetchall()
+    first = c.fetchone()
+    if first is None:
+        tk.Label(issues_window, text="No issues found.").pack()
+        return
 
-def resolve_issue(issue_id, window):
-    conn = sqlite3.connect("issues.db")
+    # One Treeview for all rows instead of a Label/Button pair per issue
+    columns = ("id", "status", "title", "location", "time", "description")
+    tree = ttk.Treeview(issues_window, columns=columns, show="headings", selectmode="browse")
+    for col, heading, width in (("id", "ID", 40), ("status", "Status", 70), ("title", "Title", 140),
+                                ("location", "Location", 100), ("time", "Reported", 130),
+                                ("description", "Description", 220)):
+        tree.heading(col, text=heading)
+        tree.column(col, width=width, anchor="w")
+
+    insert_issue_rows(tree, itertools.chain((first,), c))
+
+    scrollbar = ttk.Scrollbar(issues_window, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    tree.pack(side="top", fill="both", expand=True, padx=10, pady=(10, 0))
+    scrollbar.place(in_=tree, relx=1.0, rely=0, relheight=1.0, anchor="ne")
+
+    # Full text of the selected issue, since the description cell is clipped
+    detail = tk.Label(issues_window, text="Select an issue to see its full description.",
+                      justify="left", anchor="w", wraplength=400)
+    detail.pack(fill="x", padx=10, pady=(10, 0))
+
+    # A single resolve button acting on the selected row
+    def resolve_selected():
+        selected = tree.selection()
+        if not selected:
+            return
+        resolve_issue(int(selected[0]), tree, status_filter)
+
+    resolve_btn = tk.Button(issues_window, text="Mark as Resolved", state="disabled", command=resolve_selected)
+    resolve_btn.pack(anchor="w", padx=10, pady=10)
+
+    def on_select(event):
+        selected = tree.selection()
+        is_open = bool(selected) and tree.set(selected[0], "status") == "Open"
+        resolve_btn.configure(state="normal" if is_open else "disabled")
+        if selected:
+            row = tree.set(selected[0])
+            detail.configure(text=f"[{row['status']}] {row['title']} ({row['location']})\n"
+                                  f"Reported: {row['time']}\n{row['description']}")
+        else:
+            detail.configure(text="Select an issue to see its full description.")
+
+    tree.bind("<<TreeviewSelect>>", on_select)
+
+# Resolve one issue and update its row in place instead of reloading the window
+def resolve_issue(issue_id, tree, status_filter=None):
     c = conn.cursor()
-    c.execute("UPDATE issues SET status='Resolved' WHERE id=?", (issue_id,))
-    conn.commit()
-    conn.close()
+    c.execute("UPDATE issues SET status='Resolved' WHERE id=? AND status='Open' RETURNING id", (issue_id,))
+    resolved = c.fetchall()  # Drain the cursor so the statement finishes and commits
+    if not resolved:
+        # Someone else changed it; bring the list up to date once things are idle
+        schedule_refresh(tree, status_filter)
+        messagebox.showerror("Error", "Issue is no longer open.")
+        return
     messagebox.showinfo("Updated", "Issue marked as resolved.")
-    window.destroy()
-    show_issues("Open")
+
+    item = str(resolved[0][0])
+    if status_filter == "Open":
+        tree.delete(item)
+    else:
+        tree.set(item, "status", "Resolved")
+    # Update the button; not every Tk version fires this itself when the selected row is deleted
+    tree.event_generate("<<TreeviewSelect>>")
 
 # GUI Setup
 root = tk.Tk()